@@ -4,295 +4,407 @@ Comprehensive CareerFlow Backend API Testing
 Tests all endpoints mentioned in the review request with detailed verification
 """
 
+import atexit
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+import os
+import re
 import sys
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 
 # Backend URL from review request
 BACKEND_URL = "https://repo-preview-43.emergent.host"
 API_BASE = f"{BACKEND_URL}/api"
+# Snapshot of the preview deployment's responses, for offline runs with USE_FIXTURES=1
+CASSETTE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "comprehensive_backend_test.yaml")
 TEST_TOKEN = "test_token_abc123"
 HEADERS = {
     "Authorization": f"Bearer {TEST_TOKEN}",
     "Content-Type": "application/json"
 }
 
+# Endpoint URLs, built once at import
+HEALTH_URL = f"{API_BASE}/health"
+AUTH_ME_URL = f"{API_BASE}/auth/me"
+JOBS_URL = f"{API_BASE}/jobs"
+DASHBOARD_STATS_URL = f"{API_BASE}/dashboard/stats"
+AI_INSIGHTS_URL = f"{API_BASE}/dashboard/ai-insights"
+UPCOMING_INTERVIEWS_URL = f"{API_BASE}/dashboard/upcoming-interviews"
+SYSTEM_DESIGN_CHECKLIST_URL = f"{API_BASE}/interview-checklist/system_design"
+
+# Compact JSON prefix /api/health returns when the database ping succeeds
+HEALTHY_BODY_MARKER = b'"status":"healthy","database":"connected"'
+
+# Fields each endpoint's response must carry
+DASHBOARD_STATS_FIELDS = frozenset({"total", "applied", "rejected", "by_work_mode", "by_location"})
+AI_INSIGHTS_FIELDS = frozenset({"insights", "follow_ups"})
+INSIGHT_FIELDS = frozenset({"icon", "color", "text", "type"})
+CHECKLIST_FIELDS = frozenset({"title", "items"})
+CHECKLIST_ITEM_FIELDS = frozenset({"id", "text", "category"})
+INTERVIEW_FIELDS = frozenset({"job_id", "company_name", "position", "stage", "schedule_date"})
+
+# Enhanced AI insights format features, one bit each
+HAS_UPCOMING_INTERVIEWS = 1
+HAS_COACHING_INSIGHTS = 2
+HAS_GHOSTED_ACKNOWLEDGMENT = 4
+HAS_FOLLOW_UPS = 8
+ENHANCED_FEATURE_COUNT = 4
+
+# Insight text keywords; group 1 marks coaching, group 2 ghosted acknowledgment
+INSIGHT_KEYWORD_RE = re.compile(r"(company)|(ghost)", re.IGNORECASE)
+INSIGHT_KEYWORD_FLAGS = (None, HAS_COACHING_INSIGHTS, HAS_GHOSTED_ACKNOWLEDGMENT)
+
+# Test jobs with different statuses including ghosted; dates are relative to
+# when the script starts
+_NOW = datetime.now(timezone.utc)
+TEST_JOBS = [
+    {
+        "company_name": "TestCompanyA",
+        "position": "Senior Software Engineer",
+        "location": {"city": "San Francisco", "state": "California"},
+        "salary_range": {"min": 150000, "max": 200000},
+        "work_mode": "remote",
+        "job_type": "Software Engineer",
+        "status": "phone_screen",
+        "upcoming_stage": "system_design",
+        "upcoming_schedule": "12/25/2024",
+        "is_priority": True,
+        "date_applied": (_NOW - timedelta(days=5)).isoformat()
+    },
+    {
+        "company_name": "TestCompanyB",
+        "position": "Frontend Developer",
+        "location": {"city": "New York", "state": "New York"},
+        "salary_range": {"min": 120000, "max": 160000},
+        "work_mode": "hybrid",
+        "job_type": "Software Engineer",
+        "status": "ghosted",
+        "is_priority": False,
+        "date_applied": (_NOW - timedelta(days=20)).isoformat()
+    },
+    {
+        "company_name": "TestCompanyC",
+        "position": "Backend Engineer",
+        "location": {"city": "Austin", "state": "Texas"},
+        "salary_range": {"min": 140000, "max": 180000},
+        "work_mode": "onsite",
+        "job_type": "Software Engineer",
+        "status": "applied",
+        "is_priority": True,
+        "date_applied": (_NOW - timedelta(days=3)).isoformat()
+    }
+]
+
+# (connect, read) timeouts; a stalled connect fails in seconds
+TIMEOUT = (3.05, 10)
+CLEANUP_TIMEOUT = (3.05, 5)
+
+# One keep-alive session for the whole run, so the TLS handshake is paid once.
+# Transient gateway errors are retried with backoff for GET/DELETE only, so a
+# retried POST can't create a duplicate test job.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=["GET", "DELETE"],
+        raise_on_status=False
+    )
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+atexit.register(SESSION.close)
+
+# Cached GET /api/dashboard/ai-insights response, shared across tests
+_insights_response = None
+
 class TestResults:
     def __init__(self):
         self.passed = 0
         self.failed = 0
-        self.results = []
-    
+        # Stored column-wise; row dicts are only built when results is read
+        self._tests = []
+        self._statuses = []
+        self._messages = []
+        self._details = []
+
+    @property
+    def results(self):
+        return [
+            {"test": test, "status": status, "message": message, "details": details}
+            for test, status, message, details in zip(self._tests, self._statuses, self._messages, self._details)
+        ]
+
     def add_result(self, test_name, passed, message, details=None):
         status = "✅ PASS" if passed else "❌ FAIL"
-        self.results.append({
-            "test": test_name,
-            "status": status,
-            "message": message,
-            "details": details
-        })
+        self._tests.append(test_name)
+        self._statuses.append(status)
+        self._messages.append(message)
+        self._details.append(details)
         if passed:
             self.passed += 1
         else:
             self.failed += 1
-        print(f"{status} - {test_name}: {message}")
+        line = f"{status} - {test_name}: {message}\n"
         if details and not passed:
-            print(f"    Details: {details}")
+            line += f"    Details: {details}\n"
+        sys.stdout.write(line)
     
     def summary(self):
         total = self.passed + self.failed
         success_rate = (self.passed / total * 100) if total > 0 else 0
-        print(f"\n{'='*60}")
-        print(f"TEST SUMMARY: {self.passed}/{total} tests passed ({success_rate:.1f}% success rate)")
-        print(f"{'='*60}")
+        sys.stdout.write(
+            f"\n{'='*60}\n"
+            f"TEST SUMMARY: {self.passed}/{total} tests passed ({success_rate:.1f}% success rate)\n"
+            f"{'='*60}\n"
+        )
         return success_rate >= 80
 
+def _json(response):
+    """Parse a JSON API response; orjson is faster than response.json()"""
+    return orjson.loads(response.content)
+
+def reports_errors(label):
+    """Turn an exception raised by a test into a (False, "<label> error: ...") result"""
+    def decorator(test_func):
+        @functools.wraps(test_func)
+        def wrapper(*args, **kwargs):
+            try:
+                return test_func(*args, **kwargs)
+            except Exception as e:
+                return False, f"{label} error: {str(e)}"
+        return wrapper
+    return decorator
+
+@reports_errors("Health endpoint")
 def test_health_endpoint():
     """Test 1: Health check - GET /api/health"""
-    try:
-        response = requests.get(f"{API_BASE}/health", timeout=10)
-        
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                status = data.get("status", "unknown")
-                db_status = data.get("database", "unknown")
-                return True, f"Health endpoint working - Status: {status}, Database: {db_status}"
-            except:
-                return True, "Health endpoint responding (non-JSON response)"
-        else:
-            return False, f"Health endpoint returned {response.status_code}"
-            
-    except Exception as e:
-        return False, f"Health endpoint error: {str(e)}"
+    response = SESSION.get(HEALTH_URL, timeout=TIMEOUT)
+    
+    if response.status_code == 200:
+        # A healthy body has a fixed shape, so match its bytes before parsing
+        if HEALTHY_BODY_MARKER in response.content:
+            return True, "Health endpoint working - Status: healthy, Database: connected"
+        try:
+            data = _json(response)
+            status = data.get("status", "unknown")
+            db_status = data.get("database", "unknown")
+            return True, f"Health endpoint working - Status: {status}, Database: {db_status}"
+        except:
+            return True, "Health endpoint responding (non-JSON response)"
+    else:
+        return False, f"Health endpoint returned {response.status_code}"
 
+@reports_errors("Authentication")
 def test_authentication():
     """Test authentication with test token"""
-    try:
-        response = requests.get(f"{API_BASE}/auth/me", headers=HEADERS, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if "user_id" in data and "email" in data:
-                return True, f"Authentication working - User: {data.get('email')}"
-            else:
-                return False, "Auth response missing required fields"
+    response = SESSION.get(AUTH_ME_URL, timeout=TIMEOUT)
+    
+    if response.status_code == 200:
+        data = _json(response)
+        if "user_id" in data and "email" in data:
+            return True, f"Authentication working - User: {data.get('email')}"
         else:
-            return False, f"Authentication failed - HTTP {response.status_code}"
-            
-    except Exception as e:
-        return False, f"Authentication error: {str(e)}"
+            return False, "Auth response missing required fields"
+    else:
+        return False, f"Authentication failed - HTTP {response.status_code}"
+
+def get_ai_insights(force=False):
+    """Fetch AI insights once and reuse the response unless force is set"""
+    global _insights_response
+    if _insights_response is None or force:
+        _insights_response = SESSION.get(AI_INSIGHTS_URL, timeout=TIMEOUT)
+    return _insights_response
+
+def invalidate_ai_insights():
+    """Drop the cached AI insights after jobs are created or deleted"""
+    global _insights_response
+    _insights_response = None
 
 def create_test_jobs():
     """Create test jobs with different statuses including ghosted"""
     jobs_created = []
     
-    test_jobs = [
-        {
-            "company_name": "TestCompanyA",
-            "position": "Senior Software Engineer",
-            "location": {"city": "San Francisco", "state": "California"},
-            "salary_range": {"min": 150000, "max": 200000},
-            "work_mode": "remote",
-            "job_type": "Software Engineer",
-            "status": "phone_screen",
-            "upcoming_stage": "system_design",
-            "upcoming_schedule": "12/25/2024",
-            "is_priority": True,
-            "date_applied": (datetime.now(timezone.utc) - timedelta(days=5)).isoformat()
-        },
-        {
-            "company_name": "TestCompanyB",
-            "position": "Frontend Developer",
-            "location": {"city": "New York", "state": "New York"},
-            "salary_range": {"min": 120000, "max": 160000},
-            "work_mode": "hybrid",
-            "job_type": "Software Engineer",
-            "status": "ghosted",
-            "is_priority": False,
-            "date_applied": (datetime.now(timezone.utc) - timedelta(days=20)).isoformat()
-        },
-        {
-            "company_name": "TestCompanyC",
-            "position": "Backend Engineer",
-            "location": {"city": "Austin", "state": "Texas"},
-            "salary_range": {"min": 140000, "max": 180000},
-            "work_mode": "onsite",
-            "job_type": "Software Engineer",
-            "status": "applied",
-            "is_priority": True,
-            "date_applied": (datetime.now(timezone.utc) - timedelta(days=3)).isoformat()
-        }
-    ]
+    # The POSTs are independent; send them together and report in order
+    with ThreadPoolExecutor(max_workers=len(TEST_JOBS)) as executor:
+        futures = [executor.submit(SESSION.post, JOBS_URL, data=orjson.dumps(job_data), timeout=TIMEOUT) for job_data in TEST_JOBS]
     
-    for job_data in test_jobs:
+    out = []
+    for job_data, future in zip(TEST_JOBS, futures):
         try:
-            response = requests.post(f"{API_BASE}/jobs", headers=HEADERS, json=job_data, timeout=10)
+            response = future.result()
             if response.status_code in [200, 201]:
-                job = response.json()
+                job = _json(response)
                 jobs_created.append(job.get('job_id'))
-                print(f"   Created test job: {job_data['company_name']} - {job_data['status']}")
+                out.append(f"   Created test job: {job_data['company_name']} - {job_data['status']}\n")
         except Exception as e:
-            print(f"   Failed to create job for {job_data['company_name']}: {e}")
+            out.append(f"   Failed to create job for {job_data['company_name']}: {e}\n")
+    sys.stdout.write("".join(out))
     
+    invalidate_ai_insights()
     return jobs_created
 
+def delete_test_job(job_id):
+    """Delete one test job, ignoring failures"""
+    try:
+        SESSION.delete(f"{JOBS_URL}/{job_id}", timeout=CLEANUP_TIMEOUT)
+    except:
+        pass
+
 def cleanup_test_jobs(job_ids):
-    """Clean up test jobs"""
-    for job_id in job_ids:
-        try:
-            requests.delete(f"{API_BASE}/jobs/{job_id}", headers=HEADERS, timeout=5)
-        except:
-            pass
+    """Clean up test jobs, deleting them in parallel"""
+    with ThreadPoolExecutor(max_workers=min(8, len(job_ids) or 1)) as executor:
+        executor.map(delete_test_job, job_ids)
+    invalidate_ai_insights()
 
+@reports_errors("Dashboard stats")
 def test_dashboard_stats():
     """Test 2: Dashboard stats - GET /api/dashboard/stats - verify ghosted status is counted correctly"""
-    try:
-        response = requests.get(f"{API_BASE}/dashboard/stats", headers=HEADERS, timeout=10)
+    response = SESSION.get(DASHBOARD_STATS_URL, timeout=TIMEOUT)
+    
+    if response.status_code == 200:
+        data = _json(response)
         
-        if response.status_code == 200:
-            data = response.json()
-            
-            # Check for required fields
-            required_fields = ["total", "applied", "rejected", "by_work_mode", "by_location"]
-            missing_fields = [field for field in required_fields if field not in data]
-            
-            if missing_fields:
-                return False, f"Missing required fields: {missing_fields}"
-            
-            # Check if ghosted status is properly handled
-            has_ghosted_field = "ghosted" in data
-            total = data.get("total", 0)
-            applied = data.get("applied", 0)
-            rejected = data.get("rejected", 0)
-            ghosted = data.get("ghosted", 0)
-            
-            work_modes = data.get("by_work_mode", {})
-            
-            return True, f"Dashboard stats working - Total: {total}, Applied: {applied}, Rejected: {rejected}, Ghosted: {ghosted}, Work modes: {len(work_modes)}"
-        else:
-            return False, f"Dashboard stats returned {response.status_code}"
-            
-    except Exception as e:
-        return False, f"Dashboard stats error: {str(e)}"
-
-def test_ai_insights():
-    """Test 3: AI Insights - GET /api/dashboard/ai-insights - verify enhanced insights format"""
-    try:
-        response = requests.get(f"{API_BASE}/dashboard/ai-insights", headers=HEADERS, timeout=10)
+        # Check for required fields
+        missing_fields = sorted(DASHBOARD_STATS_FIELDS.difference(data))
         
-        if response.status_code == 200:
-            data = response.json()
-            
-            # Check for required structure
-            required_fields = ["insights", "follow_ups"]
-            missing_fields = [field for field in required_fields if field not in data]
-            
-            if missing_fields:
-                return False, f"Missing required fields: {missing_fields}"
-            
-            insights = data.get("insights", [])
-            follow_ups = data.get("follow_ups", [])
-            upcoming_interviews = data.get("upcoming_interviews", [])
-            
-            # Check insights structure
-            if insights:
-                first_insight = insights[0]
-                insight_fields = ["icon", "color", "text", "type"]
-                missing_insight_fields = [field for field in insight_fields if field not in first_insight]
-                if missing_insight_fields:
-                    return False, f"Insight missing fields: {missing_insight_fields}"
-            
-            # Check for enhanced format features
-            enhanced_features = {
-                "has_upcoming_interviews": "upcoming_interviews" in data,
-                "has_coaching_insights": any("company" in insight.get("text", "").lower() for insight in insights),
-                "has_ghosted_acknowledgment": any("ghost" in insight.get("text", "").lower() for insight in insights),
-                "has_follow_ups": len(follow_ups) > 0 or any(fu.get("summary") for fu in follow_ups)
-            }
-            
-            enhanced_count = sum(enhanced_features.values())
-            
-            return True, f"AI insights working - {len(insights)} insights, {len(follow_ups)} follow-ups, {len(upcoming_interviews)} upcoming, Enhanced features: {enhanced_count}/4"
-        else:
-            return False, f"AI insights returned {response.status_code}"
-            
-    except Exception as e:
-        return False, f"AI insights error: {str(e)}"
-
-def test_interview_checklist():
-    """Test 4: Interview Checklist - GET /api/interview-checklist/system_design?company=Google"""
-    try:
-        # Test the specific endpoint mentioned in review request
-        response = requests.get(
-            f"{API_BASE}/interview-checklist/system_design",
-            params={"company": "Google"},
-            headers=HEADERS,
-            timeout=10
-        )
+        if missing_fields:
+            return False, f"Missing required fields: {missing_fields}"
         
-        if response.status_code == 404:
-            return False, "Interview checklist endpoint not accessible (404 error) - routing issue despite function existing in code"
-        elif response.status_code != 200:
-            return False, f"Interview checklist returned {response.status_code}"
+        # Check if ghosted status is properly handled
+        has_ghosted_field = "ghosted" in data
+        total = data.get("total", 0)
+        applied = data.get("applied", 0)
+        rejected = data.get("rejected", 0)
+        ghosted = data.get("ghosted", 0)
         
-        data = response.json()
+        work_modes = data.get("by_work_mode", {})
+        
+        return True, f"Dashboard stats working - Total: {total}, Applied: {applied}, Rejected: {rejected}, Ghosted: {ghosted}, Work modes: {len(work_modes)}"
+    else:
+        return False, f"Dashboard stats returned {response.status_code}"
+
+@reports_errors("AI insights")
+def test_ai_insights():
+    """Test 3: AI Insights - GET /api/dashboard/ai-insights - verify enhanced insights format"""
+    response = get_ai_insights()
+    
+    if response.status_code == 200:
+        data = _json(response)
         
         # Check for required structure
-        required_fields = ["title", "items"]
-        missing_fields = [field for field in required_fields if field not in data]
+        missing_fields = sorted(AI_INSIGHTS_FIELDS.difference(data))
         
         if missing_fields:
             return False, f"Missing required fields: {missing_fields}"
         
-        items = data.get("items", [])
-        if not items:
-            return False, "No checklist items returned"
-        
-        # Check if items have proper structure (id, text, category)
-        first_item = items[0]
-        required_item_fields = ["id", "text", "category"]
-        missing_item_fields = [field for field in required_item_fields if field not in first_item]
+        insights = data.get("insights", [])
+        follow_ups = data.get("follow_ups", [])
+        upcoming_interviews = data.get("upcoming_interviews", [])
         
-        if missing_item_fields:
-            return False, f"Checklist item missing fields: {missing_item_fields}"
+        # Check insights structure
+        if insights:
+            first_insight = insights[0]
+            missing_insight_fields = sorted(INSIGHT_FIELDS.difference(first_insight))
+            if missing_insight_fields:
+                return False, f"Insight missing fields: {missing_insight_fields}"
         
-        # Check if company context is included
-        has_company_context = data.get("company") == "Google" or any("Google" in item.get("text", "") for item in items)
+        # Check for enhanced format features
+        enhanced_features = 0
+        if "upcoming_interviews" in data:
+            enhanced_features |= HAS_UPCOMING_INTERVIEWS
+        # One pass over the insight texts, stopping once both flags are set
+        text_features = HAS_COACHING_INSIGHTS | HAS_GHOSTED_ACKNOWLEDGMENT
+        for insight in insights:
+            for match in INSIGHT_KEYWORD_RE.finditer(insight.get("text", "")):
+                enhanced_features |= INSIGHT_KEYWORD_FLAGS[match.lastindex]
+            if enhanced_features & text_features == text_features:
+                break
+        if len(follow_ups) > 0 or any(fu.get("summary") for fu in follow_ups):
+            enhanced_features |= HAS_FOLLOW_UPS
         
-        return True, f"Interview checklist working - {len(items)} items with proper structure, Company context: {'Yes' if has_company_context else 'No'}"
+        enhanced_count = enhanced_features.bit_count()
         
-    except Exception as e:
-        return False, f"Interview checklist error: {str(e)}"
+        return True, f"AI insights working - {len(insights)} insights, {len(follow_ups)} follow-ups, {len(upcoming_interviews)} upcoming, Enhanced features: {enhanced_count}/{ENHANCED_FEATURE_COUNT}"
+    else:
+        return False, f"AI insights returned {response.status_code}"
+
+@reports_errors("Interview checklist")
+def test_interview_checklist():
+    """Test 4: Interview Checklist - GET /api/interview-checklist/system_design?company=Google"""
+    # Test the specific endpoint mentioned in review request
+    response = SESSION.get(
+        SYSTEM_DESIGN_CHECKLIST_URL,
+        params={"company": "Google"},
+        timeout=TIMEOUT
+    )
+    
+    if response.status_code == 404:
+        return False, "Interview checklist endpoint not accessible (404 error) - routing issue despite function existing in code"
+    elif response.status_code != 200:
+        return False, f"Interview checklist returned {response.status_code}"
+    
+    data = _json(response)
+    
+    # Check for required structure
+    missing_fields = sorted(CHECKLIST_FIELDS.difference(data))
+    
+    if missing_fields:
+        return False, f"Missing required fields: {missing_fields}"
+    
+    items = data.get("items", [])
+    if not items:
+        return False, "No checklist items returned"
+    
+    # Check if items have proper structure (id, text, category)
+    missing_item_fields = sorted(CHECKLIST_ITEM_FIELDS.difference(items[0]))
+    
+    if missing_item_fields:
+        return False, f"Checklist item missing fields: {missing_item_fields}"
+    
+    # Check if company context is included
+    has_company_context = data.get("company") == "Google" or any("Google" in item.get("text", "") for item in items)
+    
+    return True, f"Interview checklist working - {len(items)} items with proper structure, Company context: {'Yes' if has_company_context else 'No'}"
 
+@reports_errors("Upcoming interviews")
 def test_upcoming_interviews():
     """Test 5: Upcoming interviews - GET /api/dashboard/upcoming-interviews"""
-    try:
-        response = requests.get(f"{API_BASE}/dashboard/upcoming-interviews", headers=HEADERS, timeout=10)
+    response = SESSION.get(UPCOMING_INTERVIEWS_URL, timeout=TIMEOUT)
+    
+    if response.status_code == 200:
+        data = _json(response)
         
-        if response.status_code == 200:
-            data = response.json()
-            
-            # Should return a list (even if empty)
-            if not isinstance(data, list):
-                return False, "Upcoming interviews should return a list"
-            
-            # If there are interviews, check structure
-            if data:
-                first_interview = data[0]
-                required_fields = ["job_id", "company_name", "position", "stage", "schedule_date"]
-                missing_fields = [field for field in required_fields if field not in first_interview]
-                
-                if missing_fields:
-                    return False, f"Interview missing fields: {missing_fields}"
-            
-            return True, f"Upcoming interviews working - {len(data)} upcoming interviews"
-        else:
-            return False, f"Upcoming interviews returned {response.status_code}"
+        # Should return a list (even if empty)
+        if not isinstance(data, list):
+            return False, "Upcoming interviews should return a list"
+        
+        # If there are interviews, check structure
+        if data:
+            first_interview = data[0]
+            missing_fields = sorted(INTERVIEW_FIELDS.difference(first_interview))
             
-    except Exception as e:
-        return False, f"Upcoming interviews error: {str(e)}"
+            if missing_fields:
+                return False, f"Interview missing fields: {missing_fields}"
+        
+        return True, f"Upcoming interviews working - {len(data)} upcoming interviews"
+    else:
+        return False, f"Upcoming interviews returned {response.status_code}"
+
+def probe_status(endpoint):
+    """Return an endpoint's HTTP status"""
+    if endpoint == "/api/dashboard/ai-insights":
+        # Already fetched by the AI insights test - reuse it
+        return get_ai_insights().status_code
+    return SESSION.get(f"{BACKEND_URL}{endpoint}", timeout=TIMEOUT).status_code
 
 def test_no_500_errors():
     """Test 6: Verify no 500 errors on key endpoints"""
@@ -304,19 +416,24 @@ def test_no_500_errors():
         "/api/jobs"
     ]
     
+    # The probes are independent, so issue them all at once and report in order
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        futures = [executor.submit(probe_status, endpoint) for endpoint in endpoints]
+    
     error_count = 0
-    for endpoint in endpoints:
+    out = []
+    for endpoint, future in zip(endpoints, futures):
         try:
-            headers = HEADERS if endpoint != "/api/health" else {}
-            response = requests.get(f"{BACKEND_URL}{endpoint}", headers=headers, timeout=10)
-            if response.status_code >= 500:
+            status_code = future.result()
+            if status_code >= 500:
                 error_count += 1
-                print(f"   ❌ {endpoint}: HTTP {response.status_code}")
+                out.append(f"   ❌ {endpoint}: HTTP {status_code}\n")
             else:
-                print(f"   ✅ {endpoint}: HTTP {response.status_code}")
+                out.append(f"   ✅ {endpoint}: HTTP {status_code}\n")
         except Exception as e:
             error_count += 1
-            print(f"   ❌ {endpoint}: Exception {str(e)}")
+            out.append(f"   ❌ {endpoint}: Exception {str(e)}\n")
+    sys.stdout.write("".join(out))
     
     if error_count == 0:
         return True, f"All {len(endpoints)} endpoints returned < 500"
@@ -332,7 +449,17 @@ def main():
     
     results = TestResults()
     
-    # Test 1: Authentication (prerequisite)
+    # Test 1: Health Check, first: if the backend is down every later request
+    # would just wait out its timeout. Pass --force to run everything regardless.
+    passed, message = test_health_endpoint()
+    results.add_result("Health Check", passed, message)
+    
+    if not passed and "--force" not in sys.argv[1:]:
+        sys.stdout.write("❌ Aborting remaining tests after health failure (use --force to continue)\n")
+        results.summary()
+        return False
+    
+    # Test 2: Authentication (prerequisite)
     passed, message = test_authentication()
     results.add_result("Authentication", passed, message)
     
@@ -345,27 +472,21 @@ def main():
     job_ids = create_test_jobs()
     
     try:
-        # Test 2: Health Check
-        passed, message = test_health_endpoint()
-        results.add_result("Health Check", passed, message)
-        
-        # Test 3: Dashboard Stats (verify ghosted status counting)
-        passed, message = test_dashboard_stats()
-        results.add_result("Dashboard Stats (Ghosted Status)", passed, message)
-        
-        # Test 4: AI Insights (verify enhanced format)
-        passed, message = test_ai_insights()
-        results.add_result("AI Insights Enhanced Format", passed, message)
+        # Tests 3-6 only read state, so run them side by side and record the
+        # results in order
+        read_tests = [
+            ("Dashboard Stats (Ghosted Status)", test_dashboard_stats),
+            ("AI Insights Enhanced Format", test_ai_insights),
+            ("Interview Checklist Structure", test_interview_checklist),
+            ("Upcoming Interviews", test_upcoming_interviews)
+        ]
+        with ThreadPoolExecutor(max_workers=len(read_tests)) as executor:
+            futures = [executor.submit(test) for _, test in read_tests]
+        for (name, _), future in zip(read_tests, futures):
+            passed, message = future.result()
+            results.add_result(name, passed, message)
         
-        # Test 5: Interview Checklist (verify structure)
-        passed, message = test_interview_checklist()
-        results.add_result("Interview Checklist Structure", passed, message)
-        
-        # Test 6: Upcoming Interviews
-        passed, message = test_upcoming_interviews()
-        results.add_result("Upcoming Interviews", passed, message)
-        
-        # Test 7: No 500 Errors
+        # Test 7: No 500 Errors (reuses the AI insights response, so runs after)
         passed, message = test_no_500_errors()
         results.add_result("No 500 Errors", passed, message)
         
@@ -387,5 +508,19 @@ def main():
     return success
 
 if __name__ == "__main__":
-    success = main()
+    if os.environ.get("USE_FIXTURES") or os.environ.get("REFRESH_FIXTURES"):
+        # Offline mode: answer from the recorded preview responses. Calls
+        # not in the snapshot go to the network and get appended;
+        # REFRESH_FIXTURES=1 starts it over. Request bodies are left out of
+        # matching since the TEST_JOBS dates move with every run.
+        import vcr
+        record_mode = "all" if os.environ.get("REFRESH_FIXTURES") else "new_episodes"
+        with vcr.use_cassette(
+            CASSETTE_PATH,
+            record_mode=record_mode,
+            match_on=["method", "scheme", "host", "path", "query"]
+        ):
+            success = main()
+    else:
+        success = main()
     sys.exit(0 if success else 1)
\ No newline at end of file
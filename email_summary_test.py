@@ -6,11 +6,16 @@ Tests the specific endpoints requested in the review
 
 import asyncio
 import aiohttp
-import json
+import contextvars
+import functools
+import orjson
 from datetime import datetime, timezone, timedelta
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
+import sys
 import uuid
+import uvloop
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -22,12 +27,44 @@ BACKEND_URL = os.environ.get('EXPO_PUBLIC_BACKEND_URL', 'https://interview-coach
 API_BASE = f"{BACKEND_URL}/api"
 MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
 DB_NAME = os.environ.get('DB_NAME', 'test_database')
+# Shared request timeout; a stalled connect fails well before the overall budget
+TIMEOUT = aiohttp.ClientTimeout(total=30, connect=5)
 
 # Test data
 TEST_USER_EMAIL = "emailtest@jobtracker.com"
 TEST_USER_NAME = "Email Test User"
 TEST_SESSION_TOKEN = f"email_test_session_{uuid.uuid4().hex[:16]}"
 
+# Fields every summary must carry, and the stats each period reports
+SUMMARY_FIELDS = frozenset({"subject", "body", "to_email", "stats"})
+WEEKLY_STATS = frozenset({"weekly_applications", "status_counts", "follow_ups_count"})
+MONTHLY_STATS = frozenset({"total_applications", "monthly_applications", "status_counts", "work_mode_counts", "response_rate"})
+RESULT_ORDER = ("Valid Email Update", "Invalid Email Rejection", "Weekly Summary", "Monthly Summary")
+
+# Per-test output buffer, so tests running concurrently print as whole blocks
+_OUTPUT = contextvars.ContextVar("output", default=None)
+
+def log(line):
+    """Print a line, or buffer it while a buffered test is running"""
+    lines = _OUTPUT.get()
+    if lines is None:
+        print(line)
+    else:
+        lines.append(line)
+
+def buffered(test):
+    """Collect a test's log() lines and print them together when it finishes"""
+    @functools.wraps(test)
+    async def wrapper(self):
+        lines = []
+        token = _OUTPUT.set(lines)
+        try:
+            return await test(self)
+        finally:
+            _OUTPUT.reset(token)
+            sys.stdout.write("\n".join(lines) + "\n")
+    return wrapper
+
 class EmailSummaryTester:
     def __init__(self):
         self.session = None
@@ -37,12 +74,29 @@ class EmailSummaryTester:
         self.test_user_id = None
         self.test_results = []
 
+    async def __aenter__(self):
+        try:
+            await self.setup()
+        except BaseException:
+            await self.cleanup()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.cleanup()
+
     async def setup(self):
         """Setup test environment"""
         print("🔧 Setting up email summary test environment...")
         
-        # Setup HTTP session
-        self.session = aiohttp.ClientSession()
+        # Fail in seconds rather than per-request timeouts if the backend is down
+        await self.check_backend_reachable()
+        
+        # Setup HTTP session; one pooled keep-alive connector serves every test
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=60),
+            timeout=TIMEOUT
+        )
         
         # Setup MongoDB connection
         self.mongo_client = AsyncIOMotorClient(MONGO_URL)
@@ -56,6 +110,17 @@ class EmailSummaryTester:
         
         print(f"✅ Email summary test environment ready. Backend URL: {API_BASE}")
 
+    async def check_backend_reachable(self):
+        """Open (and drop) a plain TCP connection to the backend host"""
+        url = urlsplit(BACKEND_URL)
+        port = url.port or (443 if url.scheme == "https" else 80)
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(url.hostname, port), 2.0)
+        except (OSError, asyncio.TimeoutError) as e:
+            raise RuntimeError(f"Backend {url.hostname}:{port} unreachable: {e}") from e
+        writer.close()
+        await writer.wait_closed()
+
     async def create_test_user_and_session(self):
         """Create test user and session in MongoDB"""
         print("👤 Creating test user and session...")
@@ -174,10 +239,11 @@ class EmailSummaryTester:
         
         print(f"✅ Created {len(test_jobs)} test job applications")
 
+    @buffered
     async def test_communication_email_valid(self):
         """Test PUT /api/user/communication-email with valid email"""
-        print("\n📧 Test 1: PUT /api/user/communication-email (valid email)")
-        print("-" * 50)
+        log("\n📧 Test 1: PUT /api/user/communication-email (valid email)")
+        log("-" * 50)
         
         valid_email = "test@example.com"
         
@@ -187,35 +253,36 @@ class EmailSummaryTester:
                                       headers=self.auth_headers) as response:
                 
                 status = response.status
-                response_text = await response.text()
+                raw = await response.read()
                 
-                print(f"Status Code: {status}")
-                print(f"Response: {response_text}")
+                log(f"Status Code: {status}")
+                log(f"Response: {raw.decode(errors='replace')}")
                 
                 if status == 200:
-                    data = await response.json()
+                    data = orjson.loads(raw)
                     if data.get('communication_email') == valid_email:
-                        print("✅ PASS - Valid email accepted and saved")
+                        log("✅ PASS - Valid email accepted and saved")
                         self.test_results.append(("Valid Email Update", "PASS", "Email correctly saved"))
                         return True
                     else:
-                        print("❌ FAIL - Email not returned correctly in response")
+                        log("❌ FAIL - Email not returned correctly in response")
                         self.test_results.append(("Valid Email Update", "FAIL", "Email not returned correctly"))
                         return False
                 else:
-                    print(f"❌ FAIL - Unexpected status code: {status}")
+                    log(f"❌ FAIL - Unexpected status code: {status}")
                     self.test_results.append(("Valid Email Update", "FAIL", f"Status: {status}"))
                     return False
                     
         except Exception as e:
-            print(f"❌ ERROR: {str(e)}")
+            log(f"❌ ERROR: {str(e)}")
             self.test_results.append(("Valid Email Update", "ERROR", str(e)))
             return False
 
+    @buffered
     async def test_communication_email_invalid(self):
         """Test PUT /api/user/communication-email with invalid email"""
-        print("\n📧 Test 2: PUT /api/user/communication-email (invalid email)")
-        print("-" * 50)
+        log("\n📧 Test 2: PUT /api/user/communication-email (invalid email)")
+        log("-" * 50)
         
         invalid_email = "invalid-email"
         
@@ -225,180 +292,137 @@ class EmailSummaryTester:
                                       headers=self.auth_headers) as response:
                 
                 status = response.status
-                response_text = await response.text()
+                raw = await response.read()
                 
-                print(f"Status Code: {status}")
-                print(f"Response: {response_text}")
+                log(f"Status Code: {status}")
+                log(f"Response: {raw.decode(errors='replace')}")
                 
                 if status == 400:
-                    data = await response.json()
+                    data = orjson.loads(raw)
                     if "Invalid email format" in data.get('detail', ''):
-                        print("✅ PASS - Invalid email properly rejected with correct error message")
+                        log("✅ PASS - Invalid email properly rejected with correct error message")
                         self.test_results.append(("Invalid Email Rejection", "PASS", "Proper validation and error message"))
                         return True
                     else:
-                        print("❌ FAIL - Wrong error message")
+                        log("❌ FAIL - Wrong error message")
                         self.test_results.append(("Invalid Email Rejection", "FAIL", "Wrong error message"))
                         return False
                 else:
-                    print(f"❌ FAIL - Expected 400 for invalid email, got: {status}")
+                    log(f"❌ FAIL - Expected 400 for invalid email, got: {status}")
                     self.test_results.append(("Invalid Email Rejection", "FAIL", f"Expected 400, got {status}"))
                     return False
                     
         except Exception as e:
-            print(f"❌ ERROR: {str(e)}")
+            log(f"❌ ERROR: {str(e)}")
             self.test_results.append(("Invalid Email Rejection", "ERROR", str(e)))
             return False
 
-    async def test_weekly_summary(self):
-        """Test GET /api/email-summary/weekly"""
-        print("\n📊 Test 3: GET /api/email-summary/weekly")
-        print("-" * 50)
+    async def _test_summary(self, *, number, period, subject_marker, expected_stats, shown_stats, min_body_length, body_marker):
+        """Test GET /api/email-summary/{period}"""
+        test_name = f"{period.capitalize()} Summary"
+        log(f"\n📊 Test {number}: GET /api/email-summary/{period}")
+        log("-" * 50)
         
         try:
-            async with self.session.get(f"{API_BASE}/email-summary/weekly", 
+            async with self.session.get(f"{API_BASE}/email-summary/{period}", 
                                       headers=self.auth_headers) as response:
                 
                 status = response.status
-                response_text = await response.text()
+                raw = await response.read()
                 
-                print(f"Status Code: {status}")
-                print(f"Response Length: {len(response_text)} characters")
+                log(f"Status Code: {status}")
+                log(f"Response Length: {len(raw)} bytes")
                 
                 if status == 200:
-                    data = await response.json()
+                    data = orjson.loads(raw)
                     
-                    # Check required fields
-                    required_fields = ["subject", "body", "to_email", "stats"]
-                    missing_fields = [field for field in required_fields if field not in data]
+                    # Check required fields; present ones are indexed directly below
+                    missing_fields = sorted(SUMMARY_FIELDS - data.keys())
                     
                     if not missing_fields:
-                        print("✅ All required fields present")
+                        log("✅ All required fields present")
                         
                         # Check subject format
-                        subject = data.get("subject", "")
-                        print(f"Subject: {subject}")
+                        subject = data["subject"]
+                        log(f"Subject: {subject}")
                         
-                        if "Weekly Summary for the week" in subject:
-                            print("✅ Subject format correct")
+                        if subject_marker in subject:
+                            log("✅ Subject format correct")
                             
                             # Check stats structure
-                            stats = data.get("stats", {})
-                            expected_stats = ["weekly_applications", "status_counts", "follow_ups_count"]
-                            missing_stats = [stat for stat in expected_stats if stat not in stats]
+                            stats = data["stats"]
+                            missing_stats = sorted(expected_stats - stats.keys())
                             
                             if not missing_stats:
-                                print("✅ Stats structure correct")
-                                print(f"Weekly Applications: {stats.get('weekly_applications', 0)}")
-                                print(f"Status Counts: {stats.get('status_counts', {})}")
-                                print(f"Follow-ups Count: {stats.get('follow_ups_count', 0)}")
+                                log("✅ Stats structure correct")
+                                for line in shown_stats:
+                                    log(line.format_map(stats))
                                 
                                 # Check email content
-                                body = data.get("body", "")
-                                if len(body) > 100 and "WEEKLY METRICS" in body:
-                                    print("✅ Email body contains expected content")
-                                    self.test_results.append(("Weekly Summary", "PASS", "All fields and content correct"))
+                                body = data["body"]
+                                if len(body) > min_body_length and body_marker in body:
+                                    log("✅ Email body contains expected content")
+                                    self.test_results.append((test_name, "PASS", "All fields and content correct"))
                                     return True
                                 else:
-                                    print("❌ Email body missing expected content")
-                                    self.test_results.append(("Weekly Summary", "FAIL", "Email body incomplete"))
+                                    log("❌ Email body missing expected content")
+                                    self.test_results.append((test_name, "FAIL", "Email body incomplete"))
                                     return False
                             else:
-                                print(f"❌ Missing stats fields: {missing_stats}")
-                                self.test_results.append(("Weekly Summary", "FAIL", f"Missing stats: {missing_stats}"))
+                                log(f"❌ Missing stats fields: {missing_stats}")
+                                self.test_results.append((test_name, "FAIL", f"Missing stats: {missing_stats}"))
                                 return False
                         else:
-                            print(f"❌ Subject format incorrect: {subject}")
-                            self.test_results.append(("Weekly Summary", "FAIL", "Wrong subject format"))
+                            log(f"❌ Subject format incorrect: {subject}")
+                            self.test_results.append((test_name, "FAIL", "Wrong subject format"))
                             return False
                     else:
-                        print(f"❌ Missing required fields: {missing_fields}")
-                        self.test_results.append(("Weekly Summary", "FAIL", f"Missing fields: {missing_fields}"))
+                        log(f"❌ Missing required fields: {missing_fields}")
+                        self.test_results.append((test_name, "FAIL", f"Missing fields: {missing_fields}"))
                         return False
                 else:
-                    print(f"❌ FAIL - Unexpected status code: {status}")
-                    self.test_results.append(("Weekly Summary", "FAIL", f"Status: {status}"))
+                    log(f"❌ FAIL - Unexpected status code: {status}")
+                    self.test_results.append((test_name, "FAIL", f"Status: {status}"))
                     return False
                     
         except Exception as e:
-            print(f"❌ ERROR: {str(e)}")
-            self.test_results.append(("Weekly Summary", "ERROR", str(e)))
+            log(f"❌ ERROR: {str(e)}")
+            self.test_results.append((test_name, "ERROR", str(e)))
             return False
 
+    @buffered
+    async def test_weekly_summary(self):
+        """Test GET /api/email-summary/weekly"""
+        return await self._test_summary(
+            number=3,
+            period="weekly",
+            subject_marker="Weekly Summary for the week",
+            expected_stats=WEEKLY_STATS,
+            shown_stats=[
+                "Weekly Applications: {weekly_applications}",
+                "Status Counts: {status_counts}",
+                "Follow-ups Count: {follow_ups_count}"
+            ],
+            min_body_length=100,
+            body_marker="WEEKLY METRICS"
+        )
+
+    @buffered
     async def test_monthly_summary(self):
         """Test GET /api/email-summary/monthly"""
-        print("\n📊 Test 4: GET /api/email-summary/monthly")
-        print("-" * 50)
-        
-        try:
-            async with self.session.get(f"{API_BASE}/email-summary/monthly", 
-                                      headers=self.auth_headers) as response:
-                
-                status = response.status
-                response_text = await response.text()
-                
-                print(f"Status Code: {status}")
-                print(f"Response Length: {len(response_text)} characters")
-                
-                if status == 200:
-                    data = await response.json()
-                    
-                    # Check required fields
-                    required_fields = ["subject", "body", "to_email", "stats"]
-                    missing_fields = [field for field in required_fields if field not in data]
-                    
-                    if not missing_fields:
-                        print("✅ All required fields present")
-                        
-                        # Check subject format
-                        subject = data.get("subject", "")
-                        print(f"Subject: {subject}")
-                        
-                        if "Monthly Summary for" in subject:
-                            print("✅ Subject format correct")
-                            
-                            # Check stats structure
-                            stats = data.get("stats", {})
-                            expected_stats = ["total_applications", "monthly_applications", "status_counts", "work_mode_counts", "response_rate"]
-                            missing_stats = [stat for stat in expected_stats if stat not in stats]
-                            
-                            if not missing_stats:
-                                print("✅ Stats structure correct")
-                                print(f"Total Applications: {stats.get('total_applications', 0)}")
-                                print(f"Monthly Applications: {stats.get('monthly_applications', 0)}")
-                                print(f"Response Rate: {stats.get('response_rate', 0)}%")
-                                
-                                # Check email content
-                                body = data.get("body", "")
-                                if len(body) > 200 and "MONTHLY OVERVIEW" in body:
-                                    print("✅ Email body contains expected content")
-                                    self.test_results.append(("Monthly Summary", "PASS", "All fields and content correct"))
-                                    return True
-                                else:
-                                    print("❌ Email body missing expected content")
-                                    self.test_results.append(("Monthly Summary", "FAIL", "Email body incomplete"))
-                                    return False
-                            else:
-                                print(f"❌ Missing stats fields: {missing_stats}")
-                                self.test_results.append(("Monthly Summary", "FAIL", f"Missing stats: {missing_stats}"))
-                                return False
-                        else:
-                            print(f"❌ Subject format incorrect: {subject}")
-                            self.test_results.append(("Monthly Summary", "FAIL", "Wrong subject format"))
-                            return False
-                    else:
-                        print(f"❌ Missing required fields: {missing_fields}")
-                        self.test_results.append(("Monthly Summary", "FAIL", f"Missing fields: {missing_fields}"))
-                        return False
-                else:
-                    print(f"❌ FAIL - Unexpected status code: {status}")
-                    self.test_results.append(("Monthly Summary", "FAIL", f"Status: {status}"))
-                    return False
-                    
-        except Exception as e:
-            print(f"❌ ERROR: {str(e)}")
-            self.test_results.append(("Monthly Summary", "ERROR", str(e)))
-            return False
+        return await self._test_summary(
+            number=4,
+            period="monthly",
+            subject_marker="Monthly Summary for",
+            expected_stats=MONTHLY_STATS,
+            shown_stats=[
+                "Total Applications: {total_applications}",
+                "Monthly Applications: {monthly_applications}",
+                "Response Rate: {response_rate}%"
+            ],
+            min_body_length=200,
+            body_marker="MONTHLY OVERVIEW"
+        )
 
     async def cleanup(self):
         """Cleanup test environment"""
@@ -420,9 +444,7 @@ class EmailSummaryTester:
 
     def print_summary(self):
         """Print test summary"""
-        print("\n" + "="*60)
-        print("📋 EMAIL SUMMARY API TEST RESULTS")
-        print("="*60)
+        out = ["\n" + "="*60, "📋 EMAIL SUMMARY API TEST RESULTS", "="*60]
         
         passed = 0
         failed = 0
@@ -430,47 +452,50 @@ class EmailSummaryTester:
         
         for test_name, status, message in self.test_results:
             if status == "PASS":
-                print(f"✅ {test_name}: {message}")
+                out.append(f"✅ {test_name}: {message}")
                 passed += 1
             elif status == "FAIL":
-                print(f"❌ {test_name}: {message}")
+                out.append(f"❌ {test_name}: {message}")
                 failed += 1
             else:  # ERROR
-                print(f"🔥 {test_name}: {message}")
+                out.append(f"🔥 {test_name}: {message}")
                 errors += 1
         
         total = len(self.test_results)
-        success_rate = (passed / total * 100) if total > 0 else 0
+        success_rate = f"{passed / total:.1%}" if total else "0.0%"
         
-        print(f"\n{'='*60}")
-        print(f"TOTAL TESTS: {total}")
-        print(f"✅ PASSED: {passed}")
-        print(f"❌ FAILED: {failed}")
-        print(f"🔥 ERRORS: {errors}")
-        print(f"SUCCESS RATE: {success_rate:.1f}%")
-        print("="*60)
+        out += [
+            f"\n{'='*60}",
+            f"TOTAL TESTS: {total}",
+            f"✅ PASSED: {passed}",
+            f"❌ FAILED: {failed}",
+            f"🔥 ERRORS: {errors}",
+            f"SUCCESS RATE: {success_rate}",
+            "="*60
+        ]
+        sys.stdout.write("\n".join(out) + "\n")
         
-        return success_rate == 100.0
+        return total > 0 and passed == total
 
     async def run_all_tests(self):
         """Run all email summary tests"""
         try:
-            await self.setup()
-            
-            # Run tests in sequence
-            test1 = await self.test_communication_email_valid()
-            test2 = await self.test_communication_email_invalid()
-            test3 = await self.test_weekly_summary()
-            test4 = await self.test_monthly_summary()
-            
-            all_passed = test1 and test2 and test3 and test4
-            
+            async with self:
+                # The summaries are addressed to the communication email, so
+                # the valid update lands first; the rest are independent
+                await self.test_communication_email_valid()
+                await asyncio.gather(
+                    self.test_communication_email_invalid(),
+                    self.test_weekly_summary(),
+                    self.test_monthly_summary()
+                )
+                # The gathered tests record results as they finish; restore
+                # the run order so the summary reads the same every time
+                self.test_results.sort(key=lambda result: RESULT_ORDER.index(result[0]))
+                
         except Exception as e:
             print(f"🔥 Critical error during testing: {e}")
-            all_passed = False
-        finally:
-            await self.cleanup()
-            return self.print_summary()
+        return self.print_summary()
 
 async def main():
     """Main test runner"""
@@ -489,5 +514,8 @@ async def main():
     return success
 
 if __name__ == "__main__":
-    success = asyncio.run(main())
+    # uvloop's libuv loop cuts scheduling overhead for the gathered requests;
+    # Runner takes it as a loop factory, avoiding the deprecated uvloop.install()
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        success = runner.run(main())
     exit(0 if success else 1)
\ No newline at end of file
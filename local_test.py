@@ -1,93 +1,208 @@
 #!/usr/bin/env python3
+import os
+import sys
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 
 BASE_URL = "http://localhost:8001"
-HEADERS = {"Authorization": "Bearer test_token_abc123"}
-
-# Test 1: Create a job first
-print("Creating test job...")
-job_data = {
-    "company_name": "TestCompany",
-    "position": "Software Engineer", 
-    "location": {"city": "San Francisco", "state": "California"},
-    "salary_range": {"min": 100000, "max": 150000},
-    "work_mode": "remote",
-    "job_type": "full_time",
-    "status": "applied"
+# Recorded localhost responses that main() replays when USE_FIXTURES is set
+CASSETTE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "local_test.yaml")
+HEADERS = {
+    "Authorization": "Bearer test_token_abc123",
+    "Content-Type": "application/json"
 }
 
-response = requests.post(f"{BASE_URL}/api/jobs", headers=HEADERS, json=job_data)
-print(f"Job creation: {response.status_code}")
-if response.status_code == 200:
-    job = response.json()
-    job_id = job["job_id"]
-    print(f"Created job ID: {job_id}")
-    
-    # Test 2: Test checklist progress endpoints
-    print("\nTesting checklist progress endpoints...")
-    
-    # GET empty progress
-    response = requests.get(f"{BASE_URL}/api/checklist-progress/{job_id}/system_design", headers=HEADERS)
-    print(f"GET empty progress: {response.status_code}")
+# Endpoint URLs, built once at import; templated ones are bound format_map calls
+JOBS_URL = f"{BASE_URL}/api/jobs"
+JOB_URL = (BASE_URL + "/api/jobs/{job_id}").format_map
+CHECKLIST_PROGRESS_URL = f"{BASE_URL}/api/checklist-progress"
+STAGE_PROGRESS_URL = (BASE_URL + "/api/checklist-progress/{job_id}/{stage}").format_map
+SYSTEM_DESIGN_CHECKLIST_URL = f"{BASE_URL}/api/interview-checklist/system_design"
+DASHBOARD_STATS_URL = f"{BASE_URL}/api/dashboard/stats"
+
+# Checklist items written by the progress test and expected back
+PROGRESS_ITEMS = ("sd1", "sd2")
+
+# Jobs created by the tests, deleted together once every test has run
+_CREATED_JOBS = set()
+
+# (connect, read) timeouts; checklist generation calls an LLM, so it gets a
+# longer read budget
+TIMEOUT = (2, 5)
+CHECKLIST_TIMEOUT = (2, 60)
+
+# One keep-alive session shared by every test; the pool is sized for the
+# concurrent runners in main(). Transient gateway errors are retried with
+# backoff for idempotent methods only, so a retried POST can't duplicate a job.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.1,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=["GET", "PUT", "DELETE"],
+        raise_on_status=False
+    )
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+def _json(response):
+    """Parse a job or checklist response"""
+    return orjson.loads(response.content)
+
+def _status_only(method, url, **kwargs):
+    """Issue a request and return just its status"""
+    return SESSION.request(method, url, timeout=TIMEOUT, **kwargs).status_code
+
+def test_checklist_progress():
+    """Test 1-2: Create a job and round-trip its checklist progress"""
+    out = []
+    out.append("Creating test job...")
+    job_data = {
+        "company_name": "TestCompany",
+        "position": "Software Engineer",
+        "location": {"city": "San Francisco", "state": "California"},
+        "salary_range": {"min": 100000, "max": 150000},
+        "work_mode": "remote",
+        "job_type": "full_time",
+        "status": "applied"
+    }
+
+    response = SESSION.post(JOBS_URL, data=orjson.dumps(job_data), timeout=TIMEOUT)
+    out.append(f"Job creation: {response.status_code}")
+    if response.status_code == 200:
+        job = _json(response)
+        job_id = job["job_id"]
+        _CREATED_JOBS.add(job_id)
+        out.append(f"Created job ID: {job_id}")
+
+        # Test 2: Test checklist progress endpoints
+        out.append("\nTesting checklist progress endpoints...")
+
+        # GET empty progress
+        response = SESSION.get(STAGE_PROGRESS_URL({"job_id": job_id, "stage": "system_design"}), timeout=TIMEOUT)
+        out.append(f"GET empty progress: {response.status_code}")
+        if response.status_code == 200:
+            out.append(f"Response: {_json(response)}")
+        else:
+            out.append(f"Error: {response.text}")
+
+        # PUT progress
+        progress_data = {
+            "job_id": job_id,
+            "stage": "system_design",
+            "completed_items": PROGRESS_ITEMS
+        }
+        response = SESSION.put(CHECKLIST_PROGRESS_URL, data=orjson.dumps(progress_data), timeout=TIMEOUT)
+        out.append(f"PUT progress: {response.status_code}")
+        if response.status_code == 200:
+            out.append(f"Response: {_json(response)}")
+        else:
+            out.append(f"Error: {response.text}")
+
+        # GET saved progress
+        response = SESSION.get(STAGE_PROGRESS_URL({"job_id": job_id, "stage": "system_design"}), timeout=TIMEOUT)
+        out.append(f"GET saved progress: {response.status_code}")
+        if response.status_code == 200:
+            saved = _json(response)
+            out.append(f"Response: {saved}")
+            out.append(f"Progress matches: {tuple(saved.get('completed_items', ())) == PROGRESS_ITEMS}")
+        else:
+            out.append(f"Error: {response.text}")
+    return "\n".join(out)
+
+def test_interview_checklist():
+    """Test 3: Test interview checklist"""
+    out = []
+    out.append("\nTesting interview checklist...")
+    response = SESSION.get(SYSTEM_DESIGN_CHECKLIST_URL, timeout=CHECKLIST_TIMEOUT)
+    out.append(f"Interview checklist: {response.status_code}")
     if response.status_code == 200:
-        print(f"Response: {response.json()}")
+        data = _json(response)
+        out.append(f"Title: {data.get('title')}")
+        out.append(f"Items count: {len(data.get('items', []))}")
     else:
-        print(f"Error: {response.text}")
-    
-    # PUT progress
-    progress_data = {
-        "job_id": job_id,
-        "stage": "system_design", 
-        "completed_items": ["sd1", "sd2"]
-    }
-    response = requests.put(f"{BASE_URL}/api/checklist-progress", headers=HEADERS, json=progress_data)
-    print(f"PUT progress: {response.status_code}")
+        out.append(f"Error: {response.text}")
+    return "\n".join(out)
+
+def test_interview_checklist_with_company():
+    """Test 4: Test with company parameter"""
+    out = []
+    out.append("\nTesting interview checklist with company...")
+    response = SESSION.get(SYSTEM_DESIGN_CHECKLIST_URL, params={"company": "Google"}, timeout=CHECKLIST_TIMEOUT)
+    out.append(f"Interview checklist with company: {response.status_code}")
     if response.status_code == 200:
-        print(f"Response: {response.json()}")
+        data = _json(response)
+        out.append(f"Title: {data.get('title')}")
+        out.append(f"Company: {data.get('company')}")
+        out.append(f"Items count: {len(data.get('items', []))}")
     else:
-        print(f"Error: {response.text}")
-    
-    # GET saved progress
-    response = requests.get(f"{BASE_URL}/api/checklist-progress/{job_id}/system_design", headers=HEADERS)
-    print(f"GET saved progress: {response.status_code}")
+        out.append(f"Error: {response.text}")
+    return "\n".join(out)
+
+def test_ghosted_status_in_dashboard():
+    """Test 5: Test ghosted status in dashboard"""
+    out = []
+    out.append("\nTesting ghosted status in dashboard...")
+    response = SESSION.get(DASHBOARD_STATS_URL, timeout=TIMEOUT)
+    out.append(f"Dashboard stats: {response.status_code}")
     if response.status_code == 200:
-        print(f"Response: {response.json()}")
+        stats = _json(response)
+        out.append(f"Ghosted count: {stats.get('ghosted', 'N/A')}")
     else:
-        print(f"Error: {response.text}")
-    
-    # Clean up
-    response = requests.delete(f"{BASE_URL}/api/jobs/{job_id}", headers=HEADERS)
-    print(f"Cleanup: {response.status_code}")
-
-# Test 3: Test interview checklist
-print("\nTesting interview checklist...")
-response = requests.get(f"{BASE_URL}/api/interview-checklist/system_design", headers=HEADERS)
-print(f"Interview checklist: {response.status_code}")
-if response.status_code == 200:
-    data = response.json()
-    print(f"Title: {data.get('title')}")
-    print(f"Items count: {len(data.get('items', []))}")
-else:
-    print(f"Error: {response.text}")
-
-# Test 4: Test with company parameter
-print("\nTesting interview checklist with company...")
-response = requests.get(f"{BASE_URL}/api/interview-checklist/system_design?company=Google", headers=HEADERS)
-print(f"Interview checklist with company: {response.status_code}")
-if response.status_code == 200:
-    data = response.json()
-    print(f"Title: {data.get('title')}")
-    print(f"Company: {data.get('company')}")
-    print(f"Items count: {len(data.get('items', []))}")
-else:
-    print(f"Error: {response.text}")
-
-# Test 5: Test ghosted status in dashboard
-print("\nTesting ghosted status in dashboard...")
-response = requests.get(f"{BASE_URL}/api/dashboard/stats", headers=HEADERS)
-print(f"Dashboard stats: {response.status_code}")
-if response.status_code == 200:
-    stats = response.json()
-    print(f"Ghosted count: {stats.get('ghosted', 'N/A')}")
-else:
-    print(f"Error: {response.text}")
\ No newline at end of file
+        out.append(f"Error: {response.text}")
+    return "\n".join(out)
+
+def cleanup_test_jobs(executor):
+    """Delete every job the tests created, in parallel"""
+    job_ids = list(_CREATED_JOBS)
+    statuses = executor.map(lambda job_id: _status_only("DELETE", JOB_URL({"job_id": job_id})), job_ids)
+    sys.stdout.write("".join(
+        f"Cleanup {job_id}: {status}\n" for job_id, status in zip(job_ids, statuses)
+    ))
+    _CREATED_JOBS.clear()
+
+def run_tests(tests):
+    # The tests hit independent endpoints, so run them side by side. Each
+    # one buffers its own output, printed in order once it finishes.
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        try:
+            for output in executor.map(lambda test: test(), tests):
+                sys.stdout.write(output + "\n")
+        finally:
+            # Delete created jobs even when a test raised part way through
+            cleanup_test_jobs(executor)
+
+def main():
+    tests = [
+        test_checklist_progress,
+        test_interview_checklist,
+        test_interview_checklist_with_company,
+        test_ghosted_status_in_dashboard,
+    ]
+
+    if os.environ.get("USE_FIXTURES") or os.environ.get("REFRESH_FIXTURES"):
+        # Serve the job and checklist calls from the cassette so the run
+        # works without a server on :8001. New calls are appended to it and
+        # REFRESH_FIXTURES=1 records it from scratch. vcrpy patches the HTTP
+        # stack process-wide, so this one cassette covers every worker thread.
+        import vcr
+        record_mode = "all" if os.environ.get("REFRESH_FIXTURES") else "new_episodes"
+        with vcr.use_cassette(
+            CASSETTE_PATH,
+            record_mode=record_mode,
+            match_on=["method", "scheme", "host", "path", "query", "body"]
+        ):
+            run_tests(tests)
+    else:
+        run_tests(tests)
+
+if __name__ == "__main__":
+    main()
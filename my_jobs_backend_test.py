@@ -6,6 +6,7 @@ Tests the specific backend APIs that support My Jobs page and FAB visibility
 
 import requests
 import json
+import orjson
 import sys
 from datetime import datetime, timezone
 
@@ -16,6 +17,9 @@ API_BASE = f"{BACKEND_URL}/api"
 # Test authentication token
 TEST_TOKEN = "test_token_abc123"
 
+# Fields the My Jobs page needs on every job
+JOB_FIELDS = frozenset({'job_id', 'company_name', 'position', 'status', 'created_at'})
+
 def test_backend_connectivity():
     """Test if backend server is responding"""
     try:
@@ -93,7 +97,7 @@ def test_create_job():
             "custom_stages": []
         }
         
-        response = requests.post(f"{API_BASE}/jobs", headers=headers, json=job_data, timeout=10)
+        response = requests.post(f"{API_BASE}/jobs", headers=headers, data=orjson.dumps(job_data), timeout=10)
         
         if response.status_code == 200:
             job = response.json()
@@ -124,8 +128,7 @@ def test_jobs_list_with_data():
             # Verify job data structure for My Jobs page
             if jobs:
                 job = jobs[0]
-                required_fields = ['job_id', 'company_name', 'position', 'status', 'created_at']
-                missing_fields = [field for field in required_fields if field not in job]
+                missing_fields = sorted(JOB_FIELDS.difference(job))
                 
                 if not missing_fields:
                     print(f"✅ Job Data Structure: Complete - All required fields present")
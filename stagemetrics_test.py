@@ -5,253 +5,320 @@ Tests the specific endpoints requested in the review.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import orjson
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Backend URL from the review request
 BACKEND_URL = "https://interview-coach-96.preview.emergentagent.com"
 
+# Endpoint URLs, built once at import
+HEALTH_URL = f"{BACKEND_URL}/api/health"
+POSITIONS_URL = f"{BACKEND_URL}/api/positions"
+DASHBOARD_STATS_URL = f"{BACKEND_URL}/api/dashboard/stats"
+JOBS_URL = f"{BACKEND_URL}/api/jobs"
+
+# Dashboard stats fields we expect to see
+DASHBOARD_STATS_FIELDS = frozenset({'total', 'applied', 'by_location', 'by_work_mode', 'by_position'})
+
 # Test token for authenticated endpoints (from backend code)
 TEST_TOKEN = "test_token_abc123"
 
+# (connect, read) timeouts; the stats queries return quickly, so ten
+# seconds of read is plenty
+TIMEOUT = (3.05, 10)
+
+# Shared by the five concurrent endpoint tests; the pool keeps their HTTPS
+# connections to the preview host open between requests. The bearer token
+# rides on every call, and the public endpoints simply ignore it.
+SESSION = requests.Session()
+SESSION.headers.update({"Authorization": f"Bearer {TEST_TOKEN}"})
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        connect=2,
+        read=0,
+        status=2,
+        backoff_factor=0.25,
+        status_forcelist=[502, 503, 504],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+def _json(response):
+    """Parse the JSON body of a StageMetrics endpoint"""
+    return orjson.loads(response.content)
+
+# Report lines of the endpoint test running on this worker thread
+_output = threading.local()
+
+def log(line):
+    """Add a line to the current endpoint's report, or print it when not pooled"""
+    lines = getattr(_output, "lines", None)
+    if lines is None:
+        print(line)
+    else:
+        lines.append(line)
+
+def run_buffered(test):
+    """Run one endpoint test and return (passed, report)"""
+    _output.lines = []
+    try:
+        return test(), "\n".join(_output.lines)
+    finally:
+        _output.lines = None
+
 def test_health_endpoint():
     """Test the health check endpoint"""
-    print("🔍 Testing Health Check Endpoint...")
+    log("🔍 Testing Health Check Endpoint...")
     try:
-        url = f"{BACKEND_URL}/api/health"
-        response = requests.get(url, timeout=10)
+        url = HEALTH_URL
+        response = SESSION.get(url, timeout=TIMEOUT)
         
-        print(f"   URL: {url}")
-        print(f"   Status Code: {response.status_code}")
+        log(f"   URL: {url}")
+        log(f"   Status Code: {response.status_code}")
         
         if response.status_code == 404:
-            print("   ❌ FAIL: Health endpoint not found (404)")
+            log("   ❌ FAIL: Health endpoint not found (404)")
             return False
         elif response.status_code == 200:
-            print("   ✅ PASS: Health endpoint responding")
+            log("   ✅ PASS: Health endpoint responding")
             try:
-                data = response.json()
-                print(f"   Response: {json.dumps(data, indent=2)}")
+                data = _json(response)
+                log(f"   Response: {json.dumps(data, indent=2)}")
             except:
-                print(f"   Response: {response.text}")
+                log(f"   Response: {response.text}")
             return True
         else:
-            print(f"   ❌ FAIL: Unexpected status code {response.status_code}")
-            print(f"   Response: {response.text}")
+            log(f"   ❌ FAIL: Unexpected status code {response.status_code}")
+            log(f"   Response: {response.text}")
             return False
             
     except requests.exceptions.RequestException as e:
-        print(f"   ❌ FAIL: Request failed - {str(e)}")
+        log(f"   ❌ FAIL: Request failed - {str(e)}")
         return False
 
 def test_positions_endpoint():
     """Test the positions list endpoint with authentication"""
-    print("\n🔍 Testing Positions List Endpoint...")
+    log("\n🔍 Testing Positions List Endpoint...")
     try:
-        url = f"{BACKEND_URL}/api/positions"
-        headers = {"Authorization": f"Bearer {TEST_TOKEN}"}
-        response = requests.get(url, headers=headers, timeout=10)
+        url = POSITIONS_URL
+        response = SESSION.get(url, timeout=TIMEOUT)
         
-        print(f"   URL: {url}")
-        print(f"   Headers: Authorization: Bearer {TEST_TOKEN}")
-        print(f"   Status Code: {response.status_code}")
+        log(f"   URL: {url}")
+        log(f"   Headers: Authorization: Bearer {TEST_TOKEN}")
+        log(f"   Status Code: {response.status_code}")
         
         if response.status_code == 200:
-            print("   ✅ PASS: Positions endpoint responding correctly")
+            log("   ✅ PASS: Positions endpoint responding correctly")
             try:
-                data = response.json()
-                print(f"   Response Type: {type(data)}")
-                print(f"   Response Length: {len(data) if isinstance(data, list) else 'N/A'}")
+                data = _json(response)
+                log(f"   Response Type: {type(data)}")
+                log(f"   Response Length: {len(data) if isinstance(data, list) else 'N/A'}")
                 if isinstance(data, list) and len(data) > 0:
-                    print(f"   Sample Item: {json.dumps(data[0], indent=2)}")
+                    log(f"   Sample Item: {json.dumps(data[0], indent=2)}")
                 else:
-                    print(f"   Response: {json.dumps(data, indent=2)}")
+                    log(f"   Response: {json.dumps(data, indent=2)}")
             except Exception as e:
-                print(f"   Response (raw): {response.text}")
+                log(f"   Response (raw): {response.text}")
             return True
         elif response.status_code == 401:
-            print("   ❌ FAIL: Authentication failed (401)")
-            print(f"   Response: {response.text}")
+            log("   ❌ FAIL: Authentication failed (401)")
+            log(f"   Response: {response.text}")
             return False
         else:
-            print(f"   ❌ FAIL: Unexpected status code {response.status_code}")
-            print(f"   Response: {response.text}")
+            log(f"   ❌ FAIL: Unexpected status code {response.status_code}")
+            log(f"   Response: {response.text}")
             return False
             
     except requests.exceptions.RequestException as e:
-        print(f"   ❌ FAIL: Request failed - {str(e)}")
+        log(f"   ❌ FAIL: Request failed - {str(e)}")
         return False
 
 def test_dashboard_stats_endpoint():
     """Test the dashboard stats endpoint with mock authentication"""
-    print("\n🔍 Testing Dashboard Stats Endpoint...")
+    log("\n🔍 Testing Dashboard Stats Endpoint...")
     try:
-        url = f"{BACKEND_URL}/api/dashboard/stats"
-        headers = {"Authorization": f"Bearer {TEST_TOKEN}"}
-        response = requests.get(url, headers=headers, timeout=10)
+        url = DASHBOARD_STATS_URL
+        response = SESSION.get(url, timeout=TIMEOUT)
         
-        print(f"   URL: {url}")
-        print(f"   Headers: Authorization: Bearer {TEST_TOKEN}")
-        print(f"   Status Code: {response.status_code}")
+        log(f"   URL: {url}")
+        log(f"   Headers: Authorization: Bearer {TEST_TOKEN}")
+        log(f"   Status Code: {response.status_code}")
         
         if response.status_code == 200:
-            print("   ✅ PASS: Dashboard stats endpoint responding correctly")
+            log("   ✅ PASS: Dashboard stats endpoint responding correctly")
             try:
-                data = response.json()
-                print(f"   Response Type: {type(data)}")
+                data = _json(response)
+                log(f"   Response Type: {type(data)}")
                 
                 # Check for expected dashboard stats fields
-                expected_fields = ['total', 'applied', 'by_location', 'by_work_mode', 'by_position']
-                found_fields = [field for field in expected_fields if field in data]
-                print(f"   Expected Fields Found: {found_fields}")
+                found_fields = sorted(DASHBOARD_STATS_FIELDS.intersection(data))
+                log(f"   Expected Fields Found: {found_fields}")
                 
                 if len(found_fields) >= 3:
-                    print("   ✅ Response contains expected dashboard statistics")
+                    log("   ✅ Response contains expected dashboard statistics")
                 else:
-                    print("   ⚠️  Response may be missing some expected fields")
+                    log("   ⚠️  Response may be missing some expected fields")
                 
                 # Show sample of response
-                print(f"   Sample Response: {json.dumps(dict(list(data.items())[:5]), indent=2)}")
+                log(f"   Sample Response: {json.dumps(dict(list(data.items())[:5]), indent=2)}")
                 
             except Exception as e:
-                print(f"   Response (raw): {response.text}")
+                log(f"   Response (raw): {response.text}")
             return True
         elif response.status_code == 401:
-            print("   ❌ FAIL: Authentication failed (401)")
-            print(f"   Response: {response.text}")
+            log("   ❌ FAIL: Authentication failed (401)")
+            log(f"   Response: {response.text}")
             return False
         else:
-            print(f"   ❌ FAIL: Unexpected status code {response.status_code}")
-            print(f"   Response: {response.text}")
+            log(f"   ❌ FAIL: Unexpected status code {response.status_code}")
+            log(f"   Response: {response.text}")
             return False
             
     except requests.exceptions.RequestException as e:
-        print(f"   ❌ FAIL: Request failed - {str(e)}")
+        log(f"   ❌ FAIL: Request failed - {str(e)}")
         return False
 
 def test_jobs_endpoint():
     """Test the jobs list endpoint with mock authentication"""
-    print("\n🔍 Testing Jobs List Endpoint...")
+    log("\n🔍 Testing Jobs List Endpoint...")
     try:
-        url = f"{BACKEND_URL}/api/jobs"
-        headers = {"Authorization": f"Bearer {TEST_TOKEN}"}
-        response = requests.get(url, headers=headers, timeout=10)
+        url = JOBS_URL
+        response = SESSION.get(url, timeout=TIMEOUT)
         
-        print(f"   URL: {url}")
-        print(f"   Headers: Authorization: Bearer {TEST_TOKEN}")
-        print(f"   Status Code: {response.status_code}")
+        log(f"   URL: {url}")
+        log(f"   Headers: Authorization: Bearer {TEST_TOKEN}")
+        log(f"   Status Code: {response.status_code}")
         
         if response.status_code == 200:
-            print("   ✅ PASS: Jobs endpoint responding correctly")
+            log("   ✅ PASS: Jobs endpoint responding correctly")
             try:
-                data = response.json()
-                print(f"   Response Type: {type(data)}")
+                data = _json(response)
+                log(f"   Response Type: {type(data)}")
                 
                 # Check for expected jobs response structure
                 if isinstance(data, dict) and 'jobs' in data:
                     jobs = data['jobs']
                     pagination = data.get('pagination', {})
-                    print(f"   Jobs Count: {len(jobs)}")
-                    print(f"   Pagination: {pagination}")
+                    log(f"   Jobs Count: {len(jobs)}")
+                    log(f"   Pagination: {pagination}")
                     
                     if len(jobs) > 0:
-                        print(f"   Sample Job: {json.dumps(jobs[0], indent=2, default=str)}")
+                        log(f"   Sample Job: {json.dumps(jobs[0], indent=2, default=str)}")
                     else:
-                        print("   No jobs found (empty list)")
+                        log("   No jobs found (empty list)")
                         
                 elif isinstance(data, list):
-                    print(f"   Jobs Count: {len(data)}")
+                    log(f"   Jobs Count: {len(data)}")
                     if len(data) > 0:
-                        print(f"   Sample Job: {json.dumps(data[0], indent=2, default=str)}")
+                        log(f"   Sample Job: {json.dumps(data[0], indent=2, default=str)}")
                 else:
-                    print(f"   Unexpected Response Format: {json.dumps(data, indent=2, default=str)}")
+                    log(f"   Unexpected Response Format: {json.dumps(data, indent=2, default=str)}")
                 
             except Exception as e:
-                print(f"   JSON Parse Error: {str(e)}")
-                print(f"   Response (raw): {response.text}")
+                log(f"   JSON Parse Error: {str(e)}")
+                log(f"   Response (raw): {response.text}")
             return True
         elif response.status_code == 401:
-            print("   ❌ FAIL: Authentication failed (401)")
-            print(f"   Response: {response.text}")
+            log("   ❌ FAIL: Authentication failed (401)")
+            log(f"   Response: {response.text}")
             return False
         else:
-            print(f"   ❌ FAIL: Unexpected status code {response.status_code}")
-            print(f"   Response: {response.text}")
+            log(f"   ❌ FAIL: Unexpected status code {response.status_code}")
+            log(f"   Response: {response.text}")
             return False
             
     except requests.exceptions.RequestException as e:
-        print(f"   ❌ FAIL: Request failed - {str(e)}")
+        log(f"   ❌ FAIL: Request failed - {str(e)}")
         return False
 
 def test_backend_connectivity():
     """Test basic backend connectivity"""
-    print("🔍 Testing Backend Connectivity...")
+    log("🔍 Testing Backend Connectivity...")
     try:
         # Try to reach the backend root
-        response = requests.get(BACKEND_URL, timeout=10)
-        print(f"   Backend URL: {BACKEND_URL}")
-        print(f"   Status Code: {response.status_code}")
+        response = SESSION.get(BACKEND_URL, timeout=TIMEOUT)
+        log(f"   Backend URL: {BACKEND_URL}")
+        log(f"   Status Code: {response.status_code}")
         
         if response.status_code in [200, 404, 405]:  # Any of these means backend is responding
-            print("   ✅ PASS: Backend is responding")
+            log("   ✅ PASS: Backend is responding")
             return True
         else:
-            print(f"   ❌ FAIL: Backend returned {response.status_code}")
+            log(f"   ❌ FAIL: Backend returned {response.status_code}")
             return False
             
     except requests.exceptions.RequestException as e:
-        print(f"   ❌ FAIL: Cannot reach backend - {str(e)}")
+        log(f"   ❌ FAIL: Cannot reach backend - {str(e)}")
         return False
 
 def main():
     """Run all backend API tests"""
-    print("=" * 60)
-    print("🚀 STAGEMETRICS BACKEND API TESTING")
-    print("=" * 60)
-    print(f"Backend URL: {BACKEND_URL}")
-    print(f"Test Token: {TEST_TOKEN}")
-    print(f"Test Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("=" * 60)
-    
-    # Track test results
-    results = {}
-    
-    # Test 1: Backend Connectivity
-    results['connectivity'] = test_backend_connectivity()
+    header = [
+        "=" * 60,
+        "🚀 STAGEMETRICS BACKEND API TESTING",
+        "=" * 60,
+        f"Backend URL: {BACKEND_URL}",
+        f"Test Token: {TEST_TOKEN}",
+        f"Test Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "=" * 60
+    ]
+    # Flushed now so the header shows while the tests are in flight
+    sys.stdout.write("\n".join(header) + "\n")
+    sys.stdout.flush()
     
-    # Test 2: Health Check
-    results['health'] = test_health_endpoint()
+    # Five read-only GETs that share nothing but the session pool, so they
+    # overlap; the reports are printed below in the order listed here
+    tests = [
+        ('connectivity', test_backend_connectivity),
+        ('health', test_health_endpoint),
+        ('positions', test_positions_endpoint),
+        ('dashboard_stats', test_dashboard_stats_endpoint),
+        ('jobs', test_jobs_endpoint)
+    ]
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = [executor.submit(run_buffered, test) for _, test in tests]
     
-    # Test 3: Positions List
-    results['positions'] = test_positions_endpoint()
-    
-    # Test 4: Dashboard Stats
-    results['dashboard_stats'] = test_dashboard_stats_endpoint()
-    
-    # Test 5: Jobs List
-    results['jobs'] = test_jobs_endpoint()
+    # Track test results; everything from here on is written in one go
+    results = {}
+    out = []
+    for (name, _), future in zip(tests, futures):
+        results[name], output = future.result()
+        out.append(output)
     
     # Summary
-    print("\n" + "=" * 60)
-    print("📊 TEST SUMMARY")
-    print("=" * 60)
+    out += ["\n" + "=" * 60, "📊 TEST SUMMARY", "=" * 60]
     
     passed = sum(1 for result in results.values() if result)
     total = len(results)
     
     for test_name, result in results.items():
         status = "✅ PASS" if result else "❌ FAIL"
-        print(f"   {test_name.replace('_', ' ').title()}: {status}")
+        out.append(f"   {test_name.replace('_', ' ').title()}: {status}")
     
-    print(f"\nOverall: {passed}/{total} tests passed ({passed/total*100:.1f}%)")
+    out.append(f"\nOverall: {passed}/{total} tests passed ({passed/total*100:.1f}%)")
     
     if passed == total:
-        print("🎉 All tests passed! Backend API is working correctly.")
-        return 0
+        out.append("🎉 All tests passed! Backend API is working correctly.")
+        exit_code = 0
     else:
-        print("⚠️  Some tests failed. Please check the details above.")
-        return 1
+        out.append("⚠️  Some tests failed. Please check the details above.")
+        exit_code = 1
+    
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
+    return exit_code
 
 if __name__ == "__main__":
     exit_code = main()
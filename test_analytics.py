@@ -5,9 +5,10 @@ Quick test for analytics endpoints
 
 import asyncio
 import aiohttp
-import json
+import orjson
 from datetime import datetime, timezone, timedelta
 from motor.motor_asyncio import AsyncIOMotorClient
+from yarl import URL
 import os
 import uuid
 from dotenv import load_dotenv
@@ -21,11 +22,32 @@ BACKEND_URL = os.environ.get('EXPO_PUBLIC_BACKEND_URL', 'https://interview-coach
 API_BASE = f"{BACKEND_URL}/api"
 MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
 DB_NAME = os.environ.get('DB_NAME', 'test_database')
+# Endpoint URLs, parsed once at import
+DASHBOARD_STATS_URL = URL(f"{API_BASE}/dashboard/stats")
+ANALYTICS_URL = URL(f"{API_BASE}/analytics")
+ANALYTICS_PATTERNS_URL = URL(f"{API_BASE}/analytics/patterns")
+
+# Cap each call well under aiohttp's five-minute default so a hung
+# analytics query fails the run instead of stalling it
+TIMEOUT = aiohttp.ClientTimeout(total=30, connect=5)
 
 # Test data
 TEST_USER_EMAIL = "testuser@jobtracker.com"
 TEST_SESSION_TOKEN = f"test_session_{uuid.uuid4().hex[:16]}"
 
+async def check_endpoint(session, label, url):
+    """GET an endpoint and return its report as one block of text"""
+    out = [f"Testing {url.path}..."]
+    async with session.get(url) as response:
+        out.append(f"Status: {response.status}")
+        if response.status == 200:
+            data = orjson.loads(await response.read())
+            out.append(f"✅ {label}: {data}")
+        else:
+            error = await response.text()
+            out.append(f"❌ Error: {error}")
+    return "\n".join(out)
+
 async def test_analytics():
     """Test analytics endpoints"""
     
@@ -43,9 +65,6 @@ async def test_analytics():
         "created_at": datetime.now(timezone.utc)
     }
     
-    await db.users.delete_one({"email": TEST_USER_EMAIL})
-    await db.users.insert_one(test_user)
-    
     test_session = {
         "user_id": test_user_id,
         "session_token": TEST_SESSION_TOKEN,
@@ -53,9 +72,6 @@ async def test_analytics():
         "created_at": datetime.now(timezone.utc)
     }
     
-    await db.user_sessions.delete_one({"session_token": TEST_SESSION_TOKEN})
-    await db.user_sessions.insert_one(test_session)
-    
     auth_headers = {"Authorization": f"Bearer {TEST_SESSION_TOKEN}"}
     
     # Create a test job
@@ -74,44 +90,31 @@ async def test_analytics():
         "updated_at": datetime.now(timezone.utc)
     }
     
-    await db.jobs.insert_one(test_job)
+    # Each replace_one upsert swaps any stale document for a fresh one in a
+    # single round trip; the three writes are independent, so run together
+    await asyncio.gather(
+        db.users.replace_one({"email": TEST_USER_EMAIL}, test_user, upsert=True),
+        db.user_sessions.replace_one({"session_token": TEST_SESSION_TOKEN}, test_session, upsert=True),
+        db.jobs.insert_one(test_job)
+    )
     
-    # Test endpoints
-    async with aiohttp.ClientSession() as session:
-        print("Testing /api/dashboard/stats...")
-        async with session.get(f"{API_BASE}/dashboard/stats", headers=auth_headers) as response:
-            print(f"Status: {response.status}")
-            if response.status == 200:
-                data = await response.json()
-                print(f"✅ Dashboard stats: {data}")
-            else:
-                error = await response.text()
-                print(f"❌ Error: {error}")
-        
-        print("\nTesting /api/analytics...")
-        async with session.get(f"{API_BASE}/analytics", headers=auth_headers) as response:
-            print(f"Status: {response.status}")
-            if response.status == 200:
-                data = await response.json()
-                print(f"✅ Analytics: {data}")
-            else:
-                error = await response.text()
-                print(f"❌ Error: {error}")
-        
-        print("\nTesting /api/analytics/patterns...")
-        async with session.get(f"{API_BASE}/analytics/patterns", headers=auth_headers) as response:
-            print(f"Status: {response.status}")
-            if response.status == 200:
-                data = await response.json()
-                print(f"✅ Patterns: {data}")
-            else:
-                error = await response.text()
-                print(f"❌ Error: {error}")
+    # Test endpoints; the three GETs are independent, so fire them together
+    # and print each report in order
+    connector = aiohttp.TCPConnector(limit_per_host=64, ttl_dns_cache=300, keepalive_timeout=75)
+    async with aiohttp.ClientSession(connector=connector, timeout=TIMEOUT, headers=auth_headers) as session:
+        reports = await asyncio.gather(
+            check_endpoint(session, "Dashboard stats", DASHBOARD_STATS_URL),
+            check_endpoint(session, "Analytics", ANALYTICS_URL),
+            check_endpoint(session, "Patterns", ANALYTICS_PATTERNS_URL)
+        )
+        print("\n\n".join(reports))
     
     # Cleanup
-    await db.users.delete_one({"email": TEST_USER_EMAIL})
-    await db.user_sessions.delete_one({"session_token": TEST_SESSION_TOKEN})
-    await db.jobs.delete_one({"job_id": test_job["job_id"]})
+    await asyncio.gather(
+        db.users.delete_one({"email": TEST_USER_EMAIL}),
+        db.user_sessions.delete_one({"session_token": TEST_SESSION_TOKEN}),
+        db.jobs.delete_one({"job_id": test_job["job_id"]})
+    )
     mongo_client.close()
 
 if __name__ == "__main__":